@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import date, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import SevernTrentAPI
 from .const import (
@@ -24,6 +26,76 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+
+def _balance_or_last_known(balance_data: dict, previous: dict | None) -> dict:
+    """Return the fetched balance, or the last known one after a failed fetch.
+
+    A failed fetch reuses the previous refresh's balance, marked ``stale``,
+    so the balance sensors do not flip to unavailable for a single error.
+    A balance that is already stale is not carried over again: a second
+    failed refresh in a row leaves the balance sensors unavailable rather
+    than showing an old figure as current.
+    """
+    if balance_data:
+        return balance_data
+
+    last_known = (previous or {}).get("balance") or {}
+    if not last_known:
+        return {}
+    if last_known.get("stale"):
+        _LOGGER.warning("Balance fetch failed again; dropping last known balance")
+        return {}
+
+    _LOGGER.warning("Balance fetch failed; keeping last known balance for one refresh")
+    return {**last_known, "stale": True}
+
+
+def _estimate_meter_reading(
+    manual_data: dict[str, Any],
+    smart_data: dict[str, Any],
+    today: date,
+) -> dict[str, Any]:
+    """Estimate the current meter reading from the last official reading.
+
+    Adds the smart meter usage pre-computed since the official reading to the
+    official value. Returns the estimated ``value`` (None when it cannot be
+    estimated) and the ``attrs`` exposed by the Estimated Meter Reading sensor.
+    """
+    latest_official = manual_data.get("latest_reading")
+    official_date = manual_data.get("reading_date")
+
+    if not latest_official or not official_date:
+        return {"value": None, "attrs": {}}
+
+    try:
+        official_dt = date.fromisoformat(official_date[:10])
+    except (ValueError, TypeError) as e:
+        _LOGGER.error("Invalid official date format: %s - %s", official_date, e)
+        return {
+            "value": None,
+            "attrs": {
+                "last_official_reading": latest_official,
+                "last_official_date": official_date,
+            },
+        }
+
+    usage_since_official = smart_data.get("usage_since_official") or 0
+    daily_readings = smart_data.get("daily_readings_since_official") or []
+
+    return {
+        "value": round(latest_official + usage_since_official, 3),
+        "attrs": {
+            "last_official_reading": latest_official,
+            "last_official_date": official_date,
+            "usage_since_official": round(usage_since_official, 3) if usage_since_official else None,
+            "days_since_official": (today - official_dt).days,
+            "daily_periods_included": len(daily_readings),
+            "monthly_periods_included": smart_data.get("monthly_periods_included") or 0,
+            "estimation_note": "Official reading + daily usage (partial month) + monthly totals (complete months)",
+        },
+    }
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Severn Trent from a config entry."""
     _LOGGER.info("Setting up Severn Trent integration")
@@ -66,43 +138,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 },
             )
     
+    def fetch_data(previous: dict | None) -> dict:
+        """Fetch every dataset in a single executor job.
+
+        ``previous`` is the data from the last refresh, if any.
+        """
+        # Fetch manual readings first to get official reading date
+        manual_data = api.get_manual_meter_readings()
+
+        data = {
+            "manual_meter": manual_data,
+            # Balance (do not require it for other sensors to work)
+            "balance": _balance_or_last_known(api.get_balance(), previous),
+            # API rate limit info (diagnostic)
+            "rate_limit": api.get_rate_limit_info(),
+            # Payment schedule (direct debit etc.)
+            "payment_schedule": api.get_current_active_payment_schedule(),
+            # Meter details (digits / latest reading metadata) - diagnostic
+            "meter_details": api.get_meter_details(),
+            "outstanding_payment": api.get_outstanding_payment(),
+            # Next upcoming payment forecast
+            "next_payment": api.get_next_payment_forecast(),
+        }
+
+        # Get official reading date for smart meter data fetching
+        official_reading_date = None
+        if manual_data:
+            official_reading_date = manual_data.get("reading_date")
+
+        # Fetch smart meter readings with official date for partial month handling
+        data["smart_meter"] = smart_data = api.get_meter_readings(official_reading_date)
+        # Estimated meter reading, computed once per refresh rather than per sensor update.
+        # "Today" comes from Home Assistant's configured time zone, not the host's.
+        data["estimated_meter"] = _estimate_meter_reading(
+            manual_data or {}, smart_data or {}, dt_util.now().date()
+        )
+        # Meter serial for the device registry, resolved once for all sensors
+        data["meter_id"] = (smart_data or {}).get("meter_id") or (manual_data or {}).get("meter_id")
+        data["meter_info"] = {
+            "market_supply_point_id": api.market_supply_point_id,
+            "device_id": api.device_id,
+            "capability_type": api.capability_type,
+        }
+        return data
+
     async def async_update_data():
         """Fetch data from API."""
         try:
-            # Fetch manual readings first to get official reading date
-            manual_data = await hass.async_add_executor_job(api.get_manual_meter_readings)
-
-            # Fetch balance (do not require it for other sensors to work)
-            balance_data = await hass.async_add_executor_job(api.get_balance)
-
-            # Fetch API rate limit info (diagnostic)
-            rate_limit_data = await hass.async_add_executor_job(api.get_rate_limit_info)
-
-            # Fetch payment schedule (direct debit etc.)
-            payment_schedule_data = await hass.async_add_executor_job(
-                api.get_current_active_payment_schedule
-            )
-
-            # Fetch meter details (digits / latest reading metadata) - diagnostic
-            meter_details_data = await hass.async_add_executor_job(api.get_meter_details)
-
-            # Fetch outstanding payments
-            outstanding_payment_data = await hass.async_add_executor_job(
-                api.get_outstanding_payment
-            )
-
-            # Fetch next upcoming payment forecast
-            next_payment_data = await hass.async_add_executor_job(api.get_next_payment_forecast)
-
-            # Get official reading date for smart meter data fetching
-            official_reading_date = None
-            if manual_data:
-                official_reading_date = manual_data.get("reading_date")
-
-            # Fetch smart meter readings with official date for partial month handling
-            smart_data = await hass.async_add_executor_job(
-                api.get_meter_readings, official_reading_date
-            )
+            # One executor hop per refresh; the API client is synchronous and
+            # shares one session and token, so the calls run back to back.
+            data = await hass.async_add_executor_job(fetch_data, coordinator.data)
+            smart_data = data["smart_meter"]
+            manual_data = data["manual_meter"]
 
             if not smart_data and not manual_data:
                 _LOGGER.warning("No data returned from API")
@@ -122,22 +209,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     smart_data.get("previous_week_usage"),
                 )
 
-            # Combine both datasets
-            return {
-                "smart_meter": smart_data,
-                "manual_meter": manual_data,
-                "balance": balance_data,
-                "rate_limit": rate_limit_data,
-                "payment_schedule": payment_schedule_data,
-                "meter_details": meter_details_data,
-                "outstanding_payment": outstanding_payment_data,
-                "next_payment": next_payment_data,
-                "meter_info": {
-                    "market_supply_point_id": api.market_supply_point_id,
-                    "device_id": api.device_id,
-                    "capability_type": api.capability_type,
-                },
-            }
+            return data
         except Exception as err:
             _LOGGER.error("Error in update: %s", err, exc_info=True)
             raise UpdateFailed(f"Error communicating with API: {err}")
@@ -148,6 +220,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name="severn_trent",
         update_method=async_update_data,
         update_interval=timedelta(hours=1),  # Update every hour for testing
+        # Payloads are plain dicts/lists, so listeners only run when data changes
+        always_update=False,
     )
     
     await coordinator.async_config_entry_first_refresh()
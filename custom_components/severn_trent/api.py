@@ -1,29 +1,16 @@
 """API client for Severn Trent Water."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 import json
 import logging
+from math import fsum
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import requests
 
-
-def _api_dt(dt: datetime) -> str:
-    """Format a datetime for the Kraken GraphQL API.
-
-    The API expects ISO 8601 with a timezone indicator.
-    Avoid double-encoding: if the datetime is timezone-aware,
-    .isoformat() already includes '+00:00', so don't append 'Z'.
-    """
-    if dt.tzinfo is not None:
-        # Timezone-aware: replace +00:00 suffix with Z for clean format
-        return dt.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
-    # Naive datetime: assume UTC and append Z
-    return dt.isoformat() + "Z"
-
-
 from .const import (
     API_KEY_MUTATION,
     API_URL,
@@ -43,6 +30,65 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _api_dt(dt: datetime) -> str:
+    """Format a datetime for the Kraken GraphQL API.
+
+    The API expects ISO 8601 with a timezone indicator.
+    Avoid double-encoding: if the datetime is timezone-aware,
+    .isoformat() already includes '+00:00', so don't append 'Z'.
+    """
+    if dt.tzinfo is not None:
+        # Timezone-aware: replace +00:00 suffix with Z for clean format
+        return dt.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+    # Naive datetime: assume UTC and append Z
+    return dt.isoformat() + "Z"
+
+
+def _start_date(reading: dict[str, Any]) -> str:
+    """Sort key for monthly readings."""
+    return reading.get("start_date") or ""
+
+
+def _usage_since_official(
+    official_reading_date: str | None,
+    daily_readings: list[dict[str, Any]],
+    monthly_readings: list[dict[str, Any]],
+) -> tuple[float, int]:
+    """Sum smart meter usage recorded after the official meter reading.
+
+    Daily readings cover the partial month after a mid-month official reading;
+    monthly readings cover the complete months after it. ``monthly_readings``
+    must be sorted by ``start_date`` (oldest first), as get_meter_readings()
+    returns them. Returns the total usage and the number of monthly periods
+    included.
+    """
+    if not official_reading_date:
+        return 0, 0
+
+    try:
+        official_dt = date.fromisoformat(official_reading_date[:10])
+    except (ValueError, TypeError):
+        return 0, 0
+
+    # Monthly start dates are plain YYYY-MM-DD strings, which sort
+    # lexicographically in date order, so the included months are a suffix
+    # of the sorted list that can be found without parsing or a full scan.
+    if official_dt.day == 1:
+        first = bisect_left(
+            monthly_readings, official_dt.isoformat(), key=_start_date
+        )
+    else:
+        first = bisect_right(
+            monthly_readings, official_dt.replace(day=1).isoformat(), key=_start_date
+        )
+    included = [r.get("value", 0) for r in monthly_readings[first:]]
+
+    # fsum keeps a year of rounded daily/monthly values from drifting
+    usage = fsum(r.get("value", 0) for r in daily_readings) + fsum(included)
+    return usage, len(included)
+
+
 class SevernTrentAPI:
     """API client for Severn Trent Water."""
     
@@ -65,6 +111,7 @@ class SevernTrentAPI:
         self.token_expires_at = 0
         self._session: requests.Session | None = None
         self.meter_identifiers_fetched = False
+        self._ledger_number: str | None = None
 
     @property
     def session(self) -> requests.Session:
@@ -139,7 +186,9 @@ class SevernTrentAPI:
             _LOGGER.debug("Auth response status: %s", response.status_code)
             response.raise_for_status()
             data = response.json()
-            _LOGGER.debug("Auth response: %s", json.dumps(data, indent=2)[:500])
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # Skip serialising the response unless it will be logged
+                _LOGGER.debug("Auth response: %s", json.dumps(data, indent=2)[:500])
             
             if "data" in data and "obtainKrakenToken" in data["data"]:
                 token_data = data["data"]["obtainKrakenToken"]
@@ -280,17 +329,50 @@ class SevernTrentAPI:
             _LOGGER.error("Error fetching meter identifiers: %s", e, exc_info=True)
             return False
     
+    def _post_smart_meter_readings(
+        self,
+        headers: dict[str, str],
+        start_at: datetime,
+        end_at: datetime,
+        reading_frequency: str,
+    ) -> dict[str, Any]:
+        """POST a SmartMeterReadings query for this meter and return the JSON body."""
+        response = self.session.post(
+            API_URL,
+            headers=headers,
+            json={
+                "query": SMART_METER_READINGS_QUERY,
+                "variables": {
+                    "accountNumber": self.account_number,
+                    "startAt": _api_dt(start_at),
+                    "endAt": _api_dt(end_at),
+                    "utilityFilters": [{
+                        "waterFilters": {
+                            "readingFrequencyType": reading_frequency,
+                            "marketSupplyPointId": self.market_supply_point_id,
+                            "deviceId": self.device_id
+                        }
+                    }]
+                },
+                "operationName": "SmartMeterReadings"
+            }
+        )
+        response.raise_for_status()
+        return response.json()
+
     def get_meter_readings(self, official_reading_date: str | None = None) -> dict[str, Any]:
         """Get meter readings from the API.
 
         Args:
             official_reading_date: Optional date of last official meter reading.
                                    If provided and mid-month, fetches daily data from that date.
+
+        Returns an empty dict on failure. Otherwise the payload always contains
+        every key, but values may be None when no daily data is available, so
+        consumers should still read them with ``.get()``.
         """
-        # Re-authenticate to ensure fresh token
-        if not self.authenticate():
-            _LOGGER.error("Failed to authenticate before fetching readings")
-            return {}
+        # Reuse the current token; only re-authenticate once it has expired
+        self._ensure_valid_token()
 
         # Fetch meter identifiers if not already done
         if not self._fetch_meter_identifiers():
@@ -321,16 +403,23 @@ class SevernTrentAPI:
 
             # Get data for current week and previous complete week
             # Need to fetch enough to cover: yesterday, 7-day average, current week, AND previous week
+            # Resolve "now" once so every date derived below agrees, even across midnight
             end_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
 
             # Calculate how many days back to the start of previous week (Monday)
-            today = datetime.now(timezone.utc).date()
+            today = end_date.date()
             days_since_monday = today.weekday()  # 0 = Monday, 6 = Sunday
             current_week_monday = today - timedelta(days=days_since_monday)
             previous_week_monday = current_week_monday - timedelta(days=7)
+            previous_week_sunday = current_week_monday - timedelta(days=1)
 
             # Fetch from previous Monday (14 days back minimum) to ensure we have all data
-            start_date = datetime.combine(previous_week_monday, datetime.min.time())
+            start_date = datetime(
+                previous_week_monday.year,
+                previous_week_monday.month,
+                previous_week_monday.day,
+                tzinfo=timezone.utc,
+            )
 
             _LOGGER.info("Fetching daily readings from %s to %s (covers current + previous week)", start_date, end_date)
             
@@ -339,30 +428,10 @@ class SevernTrentAPI:
             }
             
             # Fetch daily readings using DAY_INTERVAL (matches website behavior)
-            daily_response = self.session.post(
-                API_URL,
-                headers=headers,
-                json={
-                    "query": SMART_METER_READINGS_QUERY,
-                    "variables": {
-                        "accountNumber": self.account_number,
-                        "startAt": _api_dt(start_date),
-                        "endAt": _api_dt(end_date),
-                        "utilityFilters": [{
-                            "waterFilters": {
-                                "readingFrequencyType": "DAY_INTERVAL",
-                                "marketSupplyPointId": self.market_supply_point_id,
-                                "deviceId": self.device_id
-                            }
-                        }]
-                    },
-                    "operationName": "SmartMeterReadings"
-                }
+            daily_data = self._post_smart_meter_readings(
+                headers, start_date, end_date, "DAY_INTERVAL"
             )
             
-            daily_response.raise_for_status()
-            daily_data = daily_response.json()
-            
             if "errors" in daily_data:
                 _LOGGER.error("GraphQL errors fetching daily data: %s", daily_data["errors"])
                 return {}
@@ -372,7 +441,8 @@ class SevernTrentAPI:
                 _LOGGER.error("Unexpected daily readings response structure")
                 _LOGGER.debug("Daily readings response keys: %s", list(daily_data.keys()))
                 # Log the actual response for debugging (truncated)
-                _LOGGER.debug("Daily readings response: %s", json.dumps(daily_data, indent=2)[:1000])
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Daily readings response: %s", json.dumps(daily_data, indent=2)[:1000])
                 return {}
 
             # Some accounts/meters appear to return 0 edges for DAY_INTERVAL; try an alternate enum.
@@ -383,30 +453,9 @@ class SevernTrentAPI:
                     "retrying with readingFrequencyType=DAILY",
                     self.market_supply_point_id, self.device_id,
                 )
-                daily_retry = self.session.post(
-                    API_URL,
-                    headers=headers,
-                    json={
-                        "query": SMART_METER_READINGS_QUERY,
-                        "variables": {
-                            "accountNumber": self.account_number,
-                            "startAt": _api_dt(start_date),
-                            "endAt": _api_dt(end_date),
-                            "utilityFilters": [
-                                {
-                                    "waterFilters": {
-                                        "readingFrequencyType": "DAILY",
-                                        "marketSupplyPointId": self.market_supply_point_id,
-                                        "deviceId": self.device_id,
-                                    }
-                                }
-                            ],
-                        },
-                        "operationName": "SmartMeterReadings",
-                    },
+                daily_data = self._post_smart_meter_readings(
+                    headers, start_date, end_date, "DAILY"
                 )
-                daily_retry.raise_for_status()
-                daily_data = daily_retry.json()
                 if "errors" in daily_data:
                     _LOGGER.error(
                         "GraphQL errors fetching daily data (retry): %s",
@@ -427,30 +476,10 @@ class SevernTrentAPI:
             monthly_start = end_date - timedelta(days=365)
             _LOGGER.info("Fetching monthly readings from %s to %s", monthly_start, end_date)
             
-            monthly_response = self.session.post(
-                API_URL,
-                headers=headers,
-                json={
-                    "query": SMART_METER_READINGS_QUERY,
-                    "variables": {
-                        "accountNumber": self.account_number,
-                        "startAt": _api_dt(monthly_start),
-                        "endAt": _api_dt(end_date),
-                        "utilityFilters": [{
-                            "waterFilters": {
-                                "readingFrequencyType": "MONTH_INTERVAL",
-                                "marketSupplyPointId": self.market_supply_point_id,
-                                "deviceId": self.device_id
-                            }
-                        }]
-                    },
-                    "operationName": "SmartMeterReadings"
-                }
+            monthly_data = self._post_smart_meter_readings(
+                headers, monthly_start, end_date, "MONTH_INTERVAL"
             )
             
-            monthly_response.raise_for_status()
-            monthly_data = monthly_response.json()
-            
             if "errors" in monthly_data:
                 _LOGGER.error("GraphQL errors fetching monthly data: %s", monthly_data["errors"])
                 # Continue with just daily data
@@ -477,7 +506,7 @@ class SevernTrentAPI:
 
                 start_at = node.get("startAt")
                 if start_at:
-                    date_str = start_at.split("T")[0]
+                    date_str = start_at[:10]
                     year_month = date_str[:7]
                     monthly_data_dict[year_month] = {
                         "value": round(value, 3),
@@ -485,10 +514,13 @@ class SevernTrentAPI:
                         "unit": "m³",
                     }
 
-            monthly_readings = sorted(monthly_data_dict.values(), key=lambda x: x["start_date"])
+            monthly_readings = sorted(monthly_data_dict.values(), key=_start_date)
             _LOGGER.info("Found %d monthly readings (after deduplication)", len(monthly_readings))
 
             if not measurements:
+                usage_since_official, monthly_periods_included = _usage_since_official(
+                    official_reading_date, [], monthly_readings
+                )
                 _LOGGER.warning(
                     "No daily measurements found for account %s (MSPID=%s, DeviceID=%s, "
                     "capabilityType=%s); returning monthly-only payload. "
@@ -506,12 +538,15 @@ class SevernTrentAPI:
                     "previous_week_usage": None,
                     "week_start_date": current_week_monday.isoformat(),
                     "previous_week_start_date": previous_week_monday.isoformat(),
-                    "previous_week_end_date": (current_week_monday - timedelta(days=1)).isoformat(),
+                    "previous_week_end_date": previous_week_sunday.isoformat(),
                     "days_in_current_week": 0,
                     "unit": "m³",
                     "all_readings": [],
+                    "recent_readings": [],
                     "monthly_readings": monthly_readings,
                     "daily_readings_since_official": [],
+                    "usage_since_official": usage_since_official,
+                    "monthly_periods_included": monthly_periods_included,
                 }
 
             # Process daily measurements (already aggregated by API)
@@ -527,7 +562,7 @@ class SevernTrentAPI:
                 start_at = node.get("startAt")
 
                 if start_at:
-                    date_str = start_at.split("T")[0]
+                    date_str = start_at[:10]
                     daily_totals[date_str] = value
 
             _LOGGER.debug("Daily totals: %s", daily_totals)
@@ -540,7 +575,7 @@ class SevernTrentAPI:
                 return {}
 
             # Calculate yesterday's date (today - 1 day) to match website behavior
-            yesterday = (datetime.now(timezone.utc).date() - timedelta(days=1)).isoformat()
+            yesterday = (today - timedelta(days=1)).isoformat()
 
             # Get yesterday's total from the specific date
             yesterday_total = daily_totals.get(yesterday, 0.0)
@@ -570,12 +605,16 @@ class SevernTrentAPI:
             daily_readings_since_official = []
             if official_reading_date:
                 try:
-                    official_date_str = official_reading_date.split("T")[0] if "T" in official_reading_date else official_reading_date
+                    # Keep the date part only: the partial month window starts at midnight
+                    official_date_str = official_reading_date[:10]
                     official_dt = datetime.fromisoformat(official_date_str)
-                    official_month_start = official_dt.replace(day=1)
 
                     # Check if official reading is mid-month (not on the 1st)
-                    if official_dt.day > 1:
+                    if official_dt.date() >= today:
+                        # Official reading taken today: no complete day of usage
+                        # since it yet, so there is nothing to fetch
+                        _LOGGER.debug("Official reading is from today (%s); skipping partial month fetch", official_date_str)
+                    elif official_dt.day > 1:
                         _LOGGER.info("Official reading is mid-month (%s), fetching daily data from that date", official_date_str)
 
                         # Fetch daily data from official reading date to end of that month
@@ -589,30 +628,10 @@ class SevernTrentAPI:
 
                         _LOGGER.info("Fetching partial month daily readings from %s to %s", official_date_str, partial_month_end.isoformat())
 
-                        partial_response = self.session.post(
-                            API_URL,
-                            headers=headers,
-                            json={
-                                "query": SMART_METER_READINGS_QUERY,
-                                "variables": {
-                                    "accountNumber": self.account_number,
-                                    "startAt": _api_dt(official_dt),
-                                    "endAt": _api_dt(partial_month_end),
-                                    "utilityFilters": [{
-                                        "waterFilters": {
-                                            "readingFrequencyType": "DAY_INTERVAL",
-                                            "marketSupplyPointId": self.market_supply_point_id,
-                                            "deviceId": self.device_id
-                                        }
-                                    }]
-                                },
-                                "operationName": "SmartMeterReadings"
-                            }
+                        partial_data = self._post_smart_meter_readings(
+                            headers, official_dt, partial_month_end, "DAY_INTERVAL"
                         )
 
-                        partial_response.raise_for_status()
-                        partial_data = partial_response.json()
-
                         if "errors" not in partial_data:
                             partial_properties = partial_data.get("data", {}).get("account", {}).get("properties", [])
                             if partial_properties:
@@ -627,7 +646,7 @@ class SevernTrentAPI:
 
                                     start_at = node.get("startAt")
                                     if start_at:
-                                        date_str = start_at.split("T")[0]
+                                        date_str = start_at[:10]
                                         daily_readings_since_official.append({
                                             "value": round(value, 3),
                                             "date": date_str,
@@ -644,18 +663,9 @@ class SevernTrentAPI:
             # Calculate week-to-date and previous week usage
             week_to_date_usage = 0
             previous_week_usage = 0
-            week_start_date = None
-            previous_week_start_date = None
-            previous_week_end_date = None
             days_in_current_week = 0
 
-            today = datetime.now(timezone.utc).date()
-            # Get Monday of current week (weekday() returns 0 for Monday)
-            days_since_monday = today.weekday()
-            current_week_monday = today - timedelta(days=days_since_monday)
-            previous_week_monday = current_week_monday - timedelta(days=7)
-            previous_week_sunday = current_week_monday - timedelta(days=1)
-
+            # Week boundaries were resolved once above, alongside the fetch window
             week_start_date = current_week_monday.isoformat()
             previous_week_start_date = previous_week_monday.isoformat()
             previous_week_end_date = previous_week_sunday.isoformat()
@@ -665,7 +675,7 @@ class SevernTrentAPI:
 
             for date_str, daily_total in daily_totals.items():
                 try:
-                    reading_date = datetime.fromisoformat(date_str).date()
+                    reading_date = date.fromisoformat(date_str)
 
                     # Current week (Monday to today)
                     if current_week_monday <= reading_date <= today:
@@ -683,6 +693,12 @@ class SevernTrentAPI:
 
             _LOGGER.info("Week to date usage: %s m³ (%d days)", week_to_date_usage, days_in_current_week)
             _LOGGER.info("Previous week usage: %s m³", previous_week_usage)
+
+            # Pre-filter usage since the official reading once per refresh so the
+            # estimated meter reading sensor does not have to walk the readings.
+            usage_since_official, monthly_periods_included = _usage_since_official(
+                official_reading_date, daily_readings_since_official, monthly_readings
+            )
             
             return {
                 "meter_id": f"{self.market_supply_point_id}_{self.device_id}",
@@ -698,8 +714,12 @@ class SevernTrentAPI:
                 "days_in_current_week": days_in_current_week,
                 "unit": "m³",
                 "all_readings": all_readings,
+                # Last 7 days, sliced once here rather than by the sensor on every update
+                "recent_readings": all_readings[:7],
                 "monthly_readings": monthly_readings,
-                "daily_readings_since_official": daily_readings_since_official
+                "daily_readings_since_official": daily_readings_since_official,
+                "usage_since_official": usage_since_official,
+                "monthly_periods_included": monthly_periods_included,
             }
             
         except requests.exceptions.HTTPError as e:
@@ -764,7 +784,12 @@ class SevernTrentAPI:
                 _LOGGER.warning("No manual readings found")
                 return {}
             
-            # Most recent reading first
+            # Sort once, most recent reading first, so latest/previous and
+            # all_readings agree even if the API returns them out of order.
+            # Undated readings sort last instead of failing the whole fetch.
+            readings = sorted(
+                readings, key=lambda r: r["node"].get("readingDate") or "", reverse=True
+            )
             latest = readings[0]["node"]
             latest_value = float(latest["valueCubicMetres"])
             latest_date = latest["readingDate"]
@@ -806,7 +831,7 @@ class SevernTrentAPI:
                 "all_readings": [
                     {
                         "value": float(r["node"]["valueCubicMetres"]),
-                        "date": r["node"]["readingDate"],
+                        "date": r["node"].get("readingDate"),
                         "source": r["node"]["source"]
                     }
                     for r in readings
@@ -1200,20 +1225,23 @@ class SevernTrentAPI:
             _LOGGER.error("No account number set when fetching payment forecast")
             return {}
 
-        ledgers = self.get_ledgers()
-        if not ledgers:
-            return {}
+        # The ledger number does not change for an account, so look it up once
+        if not self._ledger_number:
+            ledgers = self.get_ledgers()
+            if not ledgers:
+                return {}
 
-        ledger_number = None
-        for ledger in ledgers:
-            if ledger.get("ledgerType") == "SEVERN_TRENT_WATER":
-                ledger_number = ledger.get("number")
-                break
-        if not ledger_number:
-            ledger_number = ledgers[0].get("number")
+            for ledger in ledgers:
+                if ledger.get("ledgerType") == "SEVERN_TRENT_WATER":
+                    self._ledger_number = ledger.get("number")
+                    break
+            if not self._ledger_number:
+                self._ledger_number = ledgers[0].get("number")
 
-        if not ledger_number:
-            return {}
+            if not self._ledger_number:
+                return {}
+
+        ledger_number = self._ledger_number
 
         try:
             headers = {"Authorization": self.token}
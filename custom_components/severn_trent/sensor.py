@@ -1,8 +1,10 @@
 """Sensor platform for Severn Trent Water integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from datetime import date
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -16,6 +18,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
@@ -23,46 +26,77 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-class SevernTrentBaseSensor(SensorEntity):
+# Shared read-only empty mapping, used for missing coordinator sections and
+# as the attributes of sensors with nothing to expose.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _project(
+    source: Mapping[str, Any],
+    keys: tuple[str, ...],
+    aliases: Mapping[str, str] = _EMPTY,
+) -> dict[str, Any]:
+    """Build an attributes dict from ``keys`` in ``source``.
+
+    ``aliases`` maps an attribute name to the source key it is read from,
+    for attributes that are renamed on the way out.
+    """
+    get = source.get
+    if not aliases:
+        return {key: get(key) for key in keys}
+    return {key: get(aliases.get(key, key)) for key in keys}
+
+
+class SevernTrentBaseSensor(CoordinatorEntity[DataUpdateCoordinator], SensorEntity):
     """Base sensor with device info."""
 
     _attr_has_entity_name = True
+    _unique_id_suffix: str
+    _last_written: tuple[Any, ...] | None = None
 
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         account_number: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__()
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._account_number = account_number
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._account_number)},
-            name=f"Severn Trent Water ({self._account_number})",
-            manufacturer="Severn Trent",
-            model="Water Meter",
-        )
+        self._attr_unique_id = f"{account_number}_{self._unique_id_suffix}"
+        # Shared by every sensor of the account
+        self._attr_device_info = device_info
 
     async def async_added_to_hass(self) -> None:
+        """Subscribe via CoordinatorEntity, then publish the data already fetched."""
         await super().async_added_to_hass()
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
         self._handle_coordinator_update()
 
-    def _meter_id(self) -> str | None:
-        if not self.coordinator.data:
-            return None
+    @property
+    def available(self) -> bool:
+        """Return True when the last refresh succeeded and the sensor has a value."""
+        return self.coordinator.last_update_success and self._attr_native_value is not None
 
-        smart_meter = self.coordinator.data.get("smart_meter", {}) or {}
-        manual_meter = self.coordinator.data.get("manual_meter", {}) or {}
-        return smart_meter.get("meter_id") or manual_meter.get("meter_id")
+    def _section(self, name: str) -> Mapping[str, Any]:
+        """Return one section of the coordinator data, or an empty mapping."""
+        return (self.coordinator.data or _EMPTY).get(name) or _EMPTY
 
     def _handle_coordinator_update(self) -> None:
-        meter_id = self._meter_id()
-        if meter_id and self._attr_device_info:
-            self._attr_device_info["serial_number"] = meter_id
-        self._attr_available = self.coordinator.last_update_success and self._attr_native_value is not None
+        meter_id = (self.coordinator.data or _EMPTY).get("meter_id")
+        device_info = self._attr_device_info
+        if meter_id and device_info and device_info.get("serial_number") != meter_id:
+            device_info["serial_number"] = meter_id
+
+        # Most refreshes return the same values (meter IDs, balances between
+        # bills), so only write state when something visible has changed.
+        written = (
+            self._attr_native_value,
+            self.available,
+            self._attr_extra_state_attributes,
+        )
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
 async def async_setup_entry(
@@ -73,30 +107,39 @@ async def async_setup_entry(
     """Set up Severn Trent sensors from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     account_number = entry.data["account_number"]
-    
-    sensors = [
-        SevernTrentYesterdayUsageSensor(coordinator, account_number),
-        SevernTrentAverageDailyUsageSensor(coordinator, account_number),
-        SevernTrentWeekToDateSensor(coordinator, account_number),
-        SevernTrentPreviousWeekSensor(coordinator, account_number),
-        SevernTrentMeterReadingSensor(coordinator, account_number),
-        SevernTrentEstimatedMeterReadingSensor(coordinator, account_number),
-        SevernTrentBalanceSensor(coordinator, account_number),
-        SevernTrentOverdueBalanceSensor(coordinator, account_number),
-        SevernTrentRateLimitRemainingSensor(coordinator, account_number),
-        SevernTrentMarketSupplyPointIdSensor(coordinator, account_number),
-        SevernTrentDeviceIdSensor(coordinator, account_number),
-        SevernTrentCapabilityTypeSensor(coordinator, account_number),
-        SevernTrentPaymentAmountSensor(coordinator, account_number),
-        SevernTrentMeterDigitsSensor(coordinator, account_number),
-        SevernTrentLatestManualReadingMetaSensor(coordinator, account_number),
-        SevernTrentOutstandingPaymentSensor(coordinator, account_number),
-        SevernTrentNextPaymentAmountSensor(coordinator, account_number),
-        SevernTrentNextPaymentDateSensor(coordinator, account_number),
-        SevernTrentSmartMeterStatusSensor(coordinator, account_number),
-    ]
-
-    async_add_entities(sensors)
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, account_number)},
+        name=f"Severn Trent Water ({account_number})",
+        manufacturer="Severn Trent",
+        model="Water Meter",
+    )
+
+    async_add_entities(
+        sensor_cls(coordinator, account_number, device_info)
+        for sensor_cls in _SENSOR_CLASSES
+    )
+
+
+class _SevernTrentProjectionSensor(SevernTrentBaseSensor):
+    """Sensor whose state and attributes are read straight from one data section.
+
+    Subclasses only declare ``_section_name``, ``_value_key`` and the
+    ``_ATTR_KEYS`` (plus optional ``_ATTR_ALIASES``) to expose.
+    """
+
+    _section_name: str
+    _value_key: str
+    _ATTR_KEYS: tuple[str, ...] = ()
+    _ATTR_ALIASES: Mapping[str, str] = _EMPTY
+
+    def _handle_coordinator_update(self) -> None:
+        section = self._section(self._section_name)
+        self._attr_native_value = section.get(self._value_key)
+        if self._ATTR_KEYS:
+            self._attr_extra_state_attributes = _project(
+                section, self._ATTR_KEYS, self._ATTR_ALIASES
+            )
+        super()._handle_coordinator_update()
 
 
 class SevernTrentBalanceSensor(SevernTrentBaseSensor):
@@ -106,19 +149,11 @@ class SevernTrentBalanceSensor(SevernTrentBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "GBP"
     _attr_icon = "mdi:currency-gbp"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Balance"
-        self._attr_unique_id = f"{account_number}_balance"
+    _attr_name = "Balance"
+    _unique_id_suffix = "balance"
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        balance = data.get("balance") or {}
+        balance = self._section("balance")
         self._attr_native_value = balance.get("balance_gbp")
         attrs: dict[str, Any] = {}
         if "balance_pence" in balance:
@@ -127,121 +162,75 @@ class SevernTrentBalanceSensor(SevernTrentBaseSensor):
             attrs["overdue_balance_gbp"] = balance.get("overdue_balance_gbp")
         if "overdue_balance_pence" in balance and balance.get("overdue_balance_pence") is not None:
             attrs["overdue_balance_pence"] = balance.get("overdue_balance_pence")
+        # Set when the last fetch failed and the previous balance is shown
+        attrs["stale"] = bool(balance.get("stale"))
         self._attr_extra_state_attributes = attrs
         super()._handle_coordinator_update()
 
 
-class SevernTrentOverdueBalanceSensor(SevernTrentBaseSensor):
+class SevernTrentOverdueBalanceSensor(_SevernTrentProjectionSensor):
     """Sensor for overdue account balance."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "GBP"
     _attr_icon = "mdi:cash-alert"
+    _attr_name = "Overdue Balance"
+    _unique_id_suffix = "overdue_balance"
+    _section_name = "balance"
+    _value_key = "overdue_balance_gbp"
+    _ATTR_KEYS = ("overdue_balance_pence",)
 
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Overdue Balance"
-        self._attr_unique_id = f"{account_number}_overdue_balance"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        balance = data.get("balance") or {}
-        self._attr_native_value = balance.get("overdue_balance_gbp")
-        self._attr_extra_state_attributes = {
-            "overdue_balance_pence": balance.get("overdue_balance_pence"),
-        }
-        super()._handle_coordinator_update()
 
-
-class SevernTrentYesterdayUsageSensor(SevernTrentBaseSensor):
+class SevernTrentYesterdayUsageSensor(_SevernTrentProjectionSensor):
     """Sensor for yesterday's water usage."""
 
     _attr_device_class = SensorDeviceClass.WATER
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:water"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Yesterday Usage"
-        self._attr_unique_id = f"{account_number}_yesterday_usage"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        smart = data.get("smart_meter") or {}
-        self._attr_native_value = smart.get("yesterday_usage")
-        self._attr_extra_state_attributes = {
-            "date": smart.get("yesterday_date"),
-            "meter_id": smart.get("meter_id"),
-        }
-        super()._handle_coordinator_update()
+    _attr_name = "Yesterday Usage"
+    _unique_id_suffix = "yesterday_usage"
+    _section_name = "smart_meter"
+    _value_key = "yesterday_usage"
+    _ATTR_KEYS = ("date", "meter_id")
+    _ATTR_ALIASES = MappingProxyType({"date": "yesterday_date"})
 
 class SevernTrentAverageDailyUsageSensor(SevernTrentBaseSensor):
     """Sensor for average daily water usage over the last 7 days."""
 
     _attr_device_class = SensorDeviceClass.WATER
+    _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:water-pump"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Daily Average"
-        self._attr_unique_id = f"{account_number}_daily_average"
-
-        self._attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
+    _attr_name = "Daily Average"
+    _unique_id_suffix = "daily_average"
+    _unrecorded_attributes = frozenset({"recent_readings"})
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        smart = data.get("smart_meter") or {}
+        smart = self._section("smart_meter")
         self._attr_native_value = smart.get("daily_average")
-        all_readings = smart.get("all_readings", [])
         self._attr_extra_state_attributes = {
-            "recent_readings": all_readings[:7] if all_readings else [],
+            "recent_readings": smart.get("recent_readings") or [],
             "period": "7 days",
         }
         super()._handle_coordinator_update()
 
-class SevernTrentWeekToDateSensor(SevernTrentBaseSensor):
+class SevernTrentWeekToDateSensor(_SevernTrentProjectionSensor):
     """Sensor for water usage from Monday to present in current week."""
 
     _attr_device_class = SensorDeviceClass.WATER
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:water-outline"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Week to Date"
-        self._attr_unique_id = f"{account_number}_week_to_date"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        smart = data.get("smart_meter") or {}
-        self._attr_native_value = smart.get("week_to_date_usage")
-        self._attr_extra_state_attributes = {
-            "week_start": smart.get("week_start_date"),
-            "days_in_week": smart.get("days_in_current_week"),
-        }
-        super()._handle_coordinator_update()
+    _attr_name = "Week to Date"
+    _unique_id_suffix = "week_to_date"
+    _section_name = "smart_meter"
+    _value_key = "week_to_date_usage"
+    _ATTR_KEYS = ("week_start", "days_in_week")
+    _ATTR_ALIASES = MappingProxyType({
+        "week_start": "week_start_date",
+        "days_in_week": "days_in_current_week",
+    })
 
 
 class SevernTrentPreviousWeekSensor(SevernTrentBaseSensor):
@@ -251,20 +240,11 @@ class SevernTrentPreviousWeekSensor(SevernTrentBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:water-check-outline"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Previous Week"
-        self._attr_unique_id = f"{account_number}_previous_week"
+    _attr_name = "Previous Week"
+    _unique_id_suffix = "previous_week"
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        smart = data.get("smart_meter") or {}
+        smart = self._section("smart_meter")
         self._attr_native_value = smart.get("previous_week_usage")
         self._attr_extra_state_attributes = {
             "week_start": smart.get("previous_week_start_date"),
@@ -280,35 +260,27 @@ class SevernTrentMeterReadingSensor(SevernTrentBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:counter"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Meter Reading"
-        self._attr_unique_id = f"{account_number}_meter_reading"
+    _attr_name = "Meter Reading"
+    _unique_id_suffix = "meter_reading"
+    # Reading history stays on the live state but is not written to the recorder
+    _unrecorded_attributes = frozenset({"all_readings"})
+    _ATTR_KEYS = (
+        "reading_date",
+        "reading_source",
+        "previous_reading",
+        "previous_date",
+        "usage_since_last",
+        "days_since_last",
+        "avg_daily_usage",
+    )
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        manual = data.get("manual_meter") or {}
+        manual = self._section("manual_meter")
         self._attr_native_value = manual.get("latest_reading")
 
-        attrs: dict[str, Any] = {
-            "reading_date": manual.get("reading_date"),
-            "reading_source": manual.get("reading_source"),
-            "previous_reading": manual.get("previous_reading"),
-            "previous_date": manual.get("previous_date"),
-            "usage_since_last": manual.get("usage_since_last"),
-            "days_since_last": manual.get("days_since_last"),
-            "avg_daily_usage": manual.get("avg_daily_usage"),
-        }
-        all_readings = manual.get("all_readings", [])
-        if all_readings:
+        attrs = _project(manual, self._ATTR_KEYS)
+        if all_readings := manual.get("all_readings"):
             attrs["all_readings"] = all_readings
-
         self._attr_extra_state_attributes = attrs
         super()._handle_coordinator_update()
 
@@ -319,342 +291,155 @@ class SevernTrentEstimatedMeterReadingSensor(SevernTrentBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfVolume.CUBIC_METERS
     _attr_icon = "mdi:gauge"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Estimated Meter Reading"
-        self._attr_unique_id = f"{account_number}_estimated_meter_reading"
+    _attr_name = "Estimated Meter Reading"
+    _unique_id_suffix = "estimated_meter_reading"
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        manual_data = data.get("manual_meter") or {}
-        smart_data = data.get("smart_meter") or {}
-
-        latest_official = manual_data.get("latest_reading")
-        official_date = manual_data.get("reading_date")
-        monthly_readings = smart_data.get("monthly_readings") or []
-        daily_readings = smart_data.get("daily_readings_since_official") or []
-
-        if not latest_official or not official_date:
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {}
-            super()._handle_coordinator_update()
-            return
-
-        try:
-            official_date_str = official_date.split("T")[0] if "T" in official_date else official_date
-            official_dt = datetime.fromisoformat(official_date_str)
-        except (ValueError, AttributeError) as e:
-            _LOGGER.error("Invalid official date format: %s - %s", official_date, e)
-            self._attr_native_value = None
-            self._attr_extra_state_attributes = {
-                "last_official_reading": latest_official,
-                "last_official_date": official_date,
-            }
-            super()._handle_coordinator_update()
-            return
-
-        usage_since_official = 0
-        for reading in daily_readings:
-            usage_since_official += reading.get("value", 0)
-
-        official_month_start = official_dt.replace(day=1)
-        is_first_of_month = official_dt.day == 1
-        monthly_periods_included = 0
-
-        for reading in monthly_readings:
-            reading_date = reading.get("start_date")
-            if not reading_date:
-                continue
-            try:
-                reading_date_str = reading_date.split("T")[0] if "T" in reading_date else reading_date
-                reading_dt = datetime.fromisoformat(reading_date_str)
-            except (ValueError, AttributeError):
-                continue
-
-            if is_first_of_month:
-                should_include = reading_dt >= official_dt
-            else:
-                should_include = reading_dt > official_month_start
-
-            if should_include:
-                usage_since_official += reading.get("value", 0)
-                monthly_periods_included += 1
-
-        estimated_current = latest_official + usage_since_official
-        self._attr_native_value = round(estimated_current, 3)
-
-        days_since_official = (datetime.now() - official_dt).days
-        self._attr_extra_state_attributes = {
-            "last_official_reading": latest_official,
-            "last_official_date": official_date,
-            "usage_since_official": round(usage_since_official, 3) if usage_since_official else None,
-            "days_since_official": days_since_official,
-            "daily_periods_included": len(daily_readings),
-            "monthly_periods_included": monthly_periods_included,
-            "estimation_note": "Official reading + daily usage (partial month) + monthly totals (complete months)",
-        }
+        estimate = self._section("estimated_meter")
+        self._attr_native_value = estimate.get("value")
+        self._attr_extra_state_attributes = estimate.get("attrs") or _EMPTY
         super()._handle_coordinator_update()
 
 
-class SevernTrentRateLimitRemainingSensor(SevernTrentBaseSensor):
+class SevernTrentRateLimitRemainingSensor(_SevernTrentProjectionSensor):
     """Diagnostic sensor for API rate limit remaining points."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "points"
     _attr_icon = "mdi:api"
+    _attr_name = "API Rate Limit Remaining"
+    _unique_id_suffix = "api_rate_limit_remaining"
+    _section_name = "rate_limit"
+    _value_key = "remaining_points"
+    _ATTR_KEYS = ("is_blocked", "limit", "remaining_points", "used_points", "ttl")
 
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "API Rate Limit Remaining"
-        self._attr_unique_id = f"{account_number}_api_rate_limit_remaining"
-        self._attr_native_unit_of_measurement = "points"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        rate = data.get("rate_limit") or {}
-        self._attr_native_value = rate.get("remaining_points")
-        self._attr_extra_state_attributes = {
-            "is_blocked": rate.get("is_blocked"),
-            "limit": rate.get("limit"),
-            "remaining_points": rate.get("remaining_points"),
-            "used_points": rate.get("used_points"),
-            "ttl": rate.get("ttl"),
-        }
-        super()._handle_coordinator_update()
 
-
-class _SevernTrentMeterInfoBase(SevernTrentBaseSensor):
+class _SevernTrentMeterInfoBase(_SevernTrentProjectionSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = None
-
-    def _meter_info(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        return data.get("meter_info") or {}
+    _attr_extra_state_attributes = _EMPTY
+    _section_name = "meter_info"
 
 
 class SevernTrentMarketSupplyPointIdSensor(_SevernTrentMeterInfoBase):
     _attr_icon = "mdi:identifier"
-
-    def __init__(self, coordinator: DataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Market Supply Point ID"
-        self._attr_unique_id = f"{account_number}_market_supply_point_id"
-
-    def _handle_coordinator_update(self) -> None:
-        info = self._meter_info()
-        self._attr_native_value = info.get("market_supply_point_id")
-        self._attr_extra_state_attributes = {}
-        super()._handle_coordinator_update()
+    _attr_name = "Market Supply Point ID"
+    _unique_id_suffix = "market_supply_point_id"
+    _value_key = "market_supply_point_id"
 
 
 class SevernTrentDeviceIdSensor(_SevernTrentMeterInfoBase):
     _attr_icon = "mdi:barcode"
-
-    def __init__(self, coordinator: DataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Device ID"
-        self._attr_unique_id = f"{account_number}_device_id"
-
-    def _handle_coordinator_update(self) -> None:
-        info = self._meter_info()
-        self._attr_native_value = info.get("device_id")
-        self._attr_extra_state_attributes = {}
-        super()._handle_coordinator_update()
+    _attr_name = "Device ID"
+    _unique_id_suffix = "device_id"
+    _value_key = "device_id"
 
 
 class SevernTrentCapabilityTypeSensor(_SevernTrentMeterInfoBase):
     _attr_icon = "mdi:meter-electric-outline"
+    _attr_name = "Meter Capability"
+    _unique_id_suffix = "capability_type"
+    _value_key = "capability_type"
 
-    def __init__(self, coordinator: DataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Meter Capability"
-        self._attr_unique_id = f"{account_number}_capability_type"
-
-    def _handle_coordinator_update(self) -> None:
-        info = self._meter_info()
-        self._attr_native_value = info.get("capability_type")
-        self._attr_extra_state_attributes = {}
-        super()._handle_coordinator_update()
 
-
-class SevernTrentPaymentAmountSensor(SevernTrentBaseSensor):
+class SevernTrentPaymentAmountSensor(_SevernTrentProjectionSensor):
     """Sensor for the current active payment amount (e.g. direct debit)."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "GBP"
     _attr_icon = "mdi:cash-sync"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Payment Amount"
-        self._attr_unique_id = f"{account_number}_payment_amount"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        schedule = data.get("payment_schedule") or {}
-
-        self._attr_native_value = schedule.get("payment_amount_gbp")
-        self._attr_extra_state_attributes = {
-            "schedule_id": schedule.get("id"),
-            "payment_amount_pence": schedule.get("payment_amount_pence"),
-            "payment_day": schedule.get("payment_day"),
-            "payment_frequency": schedule.get("payment_frequency"),
-            "payment_frequency_multiplier": schedule.get("payment_frequency_multiplier"),
-            "is_variable_payment_amount": schedule.get("is_variable_payment_amount"),
-            "valid_to": schedule.get("valid_to"),
-            "schedule_type": schedule.get("schedule_type"),
-        }
-        super()._handle_coordinator_update()
-
-
-class _SevernTrentMeterDetailsBase(SevernTrentBaseSensor):
+    _attr_name = "Payment Amount"
+    _unique_id_suffix = "payment_amount"
+    _section_name = "payment_schedule"
+    _value_key = "payment_amount_gbp"
+    _ATTR_KEYS = (
+        "schedule_id",
+        "payment_amount_pence",
+        "payment_day",
+        "payment_frequency",
+        "payment_frequency_multiplier",
+        "is_variable_payment_amount",
+        "valid_to",
+        "schedule_type",
+    )
+    _ATTR_ALIASES = MappingProxyType({"schedule_id": "id"})
+
+
+class _SevernTrentMeterDetailsBase(_SevernTrentProjectionSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_state_class = None
-
-    def _meter_details(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        return data.get("meter_details") or {}
+    _section_name = "meter_details"
 
 
 class SevernTrentMeterDigitsSensor(_SevernTrentMeterDetailsBase):
     _attr_icon = "mdi:numeric"
-
-    def __init__(self, coordinator: DataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Meter Digits"
-        self._attr_unique_id = f"{account_number}_meter_digits"
-
-    def _handle_coordinator_update(self) -> None:
-        details = self._meter_details()
-        self._attr_native_value = details.get("number_of_digits")
-        self._attr_extra_state_attributes = {
-            "meter_internal_id": details.get("meter_internal_id"),
-            "serial_number": details.get("serial_number"),
-        }
-        super()._handle_coordinator_update()
+    _attr_name = "Meter Digits"
+    _unique_id_suffix = "meter_digits"
+    _value_key = "number_of_digits"
+    _ATTR_KEYS = ("meter_internal_id", "serial_number")
 
 
 class SevernTrentLatestManualReadingMetaSensor(_SevernTrentMeterDetailsBase):
     _attr_icon = "mdi:card-text-outline"
-
-    def __init__(self, coordinator: DataUpdateCoordinator, account_number: str) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Latest Reading Meta"
-        self._attr_unique_id = f"{account_number}_latest_reading_meta"
-
-    def _handle_coordinator_update(self) -> None:
-        details = self._meter_details()
-        # Use latest reading id as the state so it is stable and visible.
-        self._attr_native_value = details.get("latest_reading_id")
-        self._attr_extra_state_attributes = {
-            "latest_reading": details.get("latest_reading"),
-            "latest_reading_raw": details.get("latest_reading_raw"),
-            "latest_reading_date": details.get("latest_reading_date"),
-            "latest_reading_source": details.get("latest_reading_source"),
-            "latest_reading_is_held": details.get("latest_reading_is_held"),
-            "meter_internal_id": details.get("meter_internal_id"),
-            "serial_number": details.get("serial_number"),
-        }
-        super()._handle_coordinator_update()
-
-
-class SevernTrentOutstandingPaymentSensor(SevernTrentBaseSensor):
+    _attr_name = "Latest Reading Meta"
+    _unique_id_suffix = "latest_reading_meta"
+    # Use latest reading id as the state so it is stable and visible.
+    _value_key = "latest_reading_id"
+    _ATTR_KEYS = (
+        "latest_reading",
+        "latest_reading_raw",
+        "latest_reading_date",
+        "latest_reading_source",
+        "latest_reading_is_held",
+        "meter_internal_id",
+        "serial_number",
+    )
+
+
+class SevernTrentOutstandingPaymentSensor(_SevernTrentProjectionSensor):
     """Sensor for outstanding payments."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "GBP"
     _attr_icon = "mdi:cash-alert"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Outstanding Payment"
-        self._attr_unique_id = f"{account_number}_outstanding_payment"
-
-    def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        outstanding = data.get("outstanding_payment") or {}
-        self._attr_native_value = outstanding.get("payments_outstanding_gbp")
-        self._attr_extra_state_attributes = {
-            "payments_outstanding_pence": outstanding.get("payments_outstanding_pence"),
-        }
-        super()._handle_coordinator_update()
+    _attr_name = "Outstanding Payment"
+    _unique_id_suffix = "outstanding_payment"
+    _section_name = "outstanding_payment"
+    _value_key = "payments_outstanding_gbp"
+    _ATTR_KEYS = ("payments_outstanding_pence",)
 
 
-class _SevernTrentNextPaymentBase(SevernTrentBaseSensor):
-    def _next_payment(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        return data.get("next_payment") or {}
-
-
-class SevernTrentNextPaymentAmountSensor(_SevernTrentNextPaymentBase):
+class SevernTrentNextPaymentAmountSensor(_SevernTrentProjectionSensor):
     """Sensor for the next upcoming payment amount."""
 
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = "GBP"
     _attr_icon = "mdi:calendar-cash"
+    _attr_name = "Next Payment Amount"
+    _unique_id_suffix = "next_payment_amount"
+    _section_name = "next_payment"
+    _value_key = "amount_gbp"
+    _ATTR_KEYS = ("amount_pence", "date", "ledger_number")
 
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Next Payment Amount"
-        self._attr_unique_id = f"{account_number}_next_payment_amount"
 
-    def _handle_coordinator_update(self) -> None:
-        nxt = self._next_payment()
-        self._attr_native_value = nxt.get("amount_gbp")
-        self._attr_extra_state_attributes = {
-            "amount_pence": nxt.get("amount_pence"),
-            "date": nxt.get("date"),
-            "ledger_number": nxt.get("ledger_number"),
-        }
-        super()._handle_coordinator_update()
-
-
-class SevernTrentNextPaymentDateSensor(_SevernTrentNextPaymentBase):
+class SevernTrentNextPaymentDateSensor(SevernTrentBaseSensor):
     """Sensor for the next upcoming payment date."""
 
     _attr_device_class = SensorDeviceClass.DATE
     _attr_icon = "mdi:calendar"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Next Payment Date"
-        self._attr_unique_id = f"{account_number}_next_payment_date"
+    _attr_name = "Next Payment Date"
+    _unique_id_suffix = "next_payment_date"
 
     def _handle_coordinator_update(self) -> None:
-        nxt = self._next_payment()
+        nxt = self._section("next_payment")
         date_str = nxt.get("date")
         if isinstance(date_str, str) and date_str:
             try:
-                self._attr_native_value = datetime.fromisoformat(date_str).date()
+                self._attr_native_value = date.fromisoformat(date_str[:10])
             except ValueError:
                 self._attr_native_value = None
         else:
@@ -673,20 +458,12 @@ class SevernTrentSmartMeterStatusSensor(SevernTrentBaseSensor):
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:wifi"
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        account_number: str,
-    ) -> None:
-        super().__init__(coordinator, account_number)
-        self._attr_name = "Smart Meter Status"
-        self._attr_unique_id = f"{account_number}_smart_meter_status"
+    _attr_name = "Smart Meter Status"
+    _unique_id_suffix = "smart_meter_status"
 
     def _handle_coordinator_update(self) -> None:
-        data = self.coordinator.data or {}
-        smart = data.get("smart_meter") or {}
-        manual = data.get("manual_meter") or {}
+        smart = self._section("smart_meter")
+        manual = self._section("manual_meter")
 
         if not smart and not manual:
             self._attr_native_value = "error"
@@ -719,7 +496,31 @@ class SevernTrentSmartMeterStatusSensor(SevernTrentBaseSensor):
                 "week_to_date_usage": wtd,
                 "previous_week_usage": prev_week,
                 "meter_id": smart.get("meter_id"),
-                "monthly_readings_count": len(smart.get("monthly_readings", [])),
-                "all_readings_count": len(smart.get("all_readings", [])),
+                "monthly_readings_count": len(smart.get("monthly_readings") or []),
+                "all_readings_count": len(smart.get("all_readings") or []),
             }
-        super()._handle_coordinator_update()
\ No newline at end of file
+        super()._handle_coordinator_update()
+
+
+# Sensors created for each config entry, in registration order.
+_SENSOR_CLASSES: tuple[type[SevernTrentBaseSensor], ...] = (
+    SevernTrentYesterdayUsageSensor,
+    SevernTrentAverageDailyUsageSensor,
+    SevernTrentWeekToDateSensor,
+    SevernTrentPreviousWeekSensor,
+    SevernTrentMeterReadingSensor,
+    SevernTrentEstimatedMeterReadingSensor,
+    SevernTrentBalanceSensor,
+    SevernTrentOverdueBalanceSensor,
+    SevernTrentRateLimitRemainingSensor,
+    SevernTrentMarketSupplyPointIdSensor,
+    SevernTrentDeviceIdSensor,
+    SevernTrentCapabilityTypeSensor,
+    SevernTrentPaymentAmountSensor,
+    SevernTrentMeterDigitsSensor,
+    SevernTrentLatestManualReadingMetaSensor,
+    SevernTrentOutstandingPaymentSensor,
+    SevernTrentNextPaymentAmountSensor,
+    SevernTrentNextPaymentDateSensor,
+    SevernTrentSmartMeterStatusSensor,
+)
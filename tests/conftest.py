@@ -22,6 +22,8 @@ for mod in [
     "homeassistant.exceptions",
     "homeassistant.helpers",
     "homeassistant.helpers.update_coordinator",
+    "homeassistant.util",
+    "homeassistant.util.dt",
 ]:
     if mod not in sys.modules:
         sys.modules[mod] = MagicMock()
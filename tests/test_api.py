@@ -7,6 +7,7 @@ and correctly parses the expected JSON response shape.
 """
 from __future__ import annotations
 
+import copy
 import json
 import time
 from unittest.mock import MagicMock, patch, call
@@ -541,6 +542,20 @@ class TestGetPaymentForecast:
             assert result["amount_pence"] == 2500
             assert result["amount_gbp"] == 25.0
 
+    def test_payment_forecast_reuses_ledger_number(self, authenticated_api: SevernTrentAPI):
+        """get_next_payment_forecast() should only look up ledgers once."""
+        with patch.object(authenticated_api.session, "post") as mock_post:
+            mock_post.side_effect = [
+                _make_response(LEDGERS_RESPONSE),
+                _make_response(PAYMENT_FORECAST_RESPONSE),
+                _make_response(PAYMENT_FORECAST_RESPONSE),
+            ]
+            authenticated_api.get_next_payment_forecast()
+            result = authenticated_api.get_next_payment_forecast()
+            assert mock_post.call_count == 3
+            assert _post_call_args(mock_post, call_index=2)["json"]["query"] == PAYMENT_FORECAST_QUERY
+            assert result["ledger_number"] == "LEDGER1"
+
 
 # ======================================================================
 # 12. Get Manual Meter Readings
@@ -574,6 +589,38 @@ class TestGetManualMeterReadings:
             assert result["usage_since_last"] == 4.5  # 1234.5 - 1230.0
             assert len(result["all_readings"]) == 2
 
+    def test_manual_readings_sorted_newest_first(self, authenticated_api: SevernTrentAPI):
+        """get_manual_meter_readings() should order readings newest first."""
+        response = copy.deepcopy(MANUAL_READINGS_RESPONSE)
+        edges = response["data"]["account"]["properties"][0]["activeWaterMeters"][0]["readings"]["edges"]
+        edges.reverse()
+        with patch.object(authenticated_api.session, "post", return_value=_make_response(response)):
+            result = authenticated_api.get_manual_meter_readings()
+            assert result["latest_reading"] == 1234.5
+            assert result["previous_reading"] == 1230.0
+            assert [r["date"] for r in result["all_readings"]] == [
+                "2026-05-01T00:00:00Z",
+                "2026-04-01T00:00:00Z",
+            ]
+
+    def test_manual_readings_sort_tolerates_undated_reading(self, authenticated_api: SevernTrentAPI):
+        """A reading with a null date should sort last rather than fail the fetch."""
+        response = copy.deepcopy(MANUAL_READINGS_RESPONSE)
+        edges = response["data"]["account"]["properties"][0]["activeWaterMeters"][0]["readings"]["edges"]
+        edges.reverse()
+        edges.insert(1, {
+            "node": {"valueCubicMetres": 1200.0, "readingDate": None, "source": "ESTIMATE"}
+        })
+        with patch.object(authenticated_api.session, "post", return_value=_make_response(response)):
+            result = authenticated_api.get_manual_meter_readings()
+            assert result["latest_reading"] == 1234.5
+            assert result["previous_reading"] == 1230.0
+            assert [r["date"] for r in result["all_readings"]] == [
+                "2026-05-01T00:00:00Z",
+                "2026-04-01T00:00:00Z",
+                None,
+            ]
+
 
 # ======================================================================
 # 13. Token Refresh
@@ -652,6 +699,21 @@ class TestGetMeterReadings:
             # At minimum, the first call should be authentication
             assert api.session.post.call_count >= 1
 
+    def test_get_meter_readings_reuses_valid_token(self, authenticated_api: SevernTrentAPI):
+        """get_meter_readings() should not re-authenticate while the token is valid."""
+        responses = [
+            _make_response(METER_IDENTIFIERS_RESPONSE),
+            _make_response(SMART_METER_DAILY_RESPONSE),
+            _make_response(SMART_METER_MONTHLY_RESPONSE),
+        ]
+        with patch.object(authenticated_api.session, "post", MagicMock(side_effect=responses)):
+            result = authenticated_api.get_meter_readings()
+            queries = [
+                c[1]["json"]["query"] for c in authenticated_api.session.post.call_args_list
+            ]
+        assert AUTH_MUTATION not in queries
+        assert result["meter_id"]
+
     def test_get_meter_readings_sends_smart_meter_query(self, api: SevernTrentAPI):
         """get_meter_readings() should send SMART_METER_READINGS_QUERY for daily data."""
         with self._setup_mock_post(api):
@@ -667,6 +729,73 @@ class TestGetMeterReadings:
             assert payload["query"] == SMART_METER_READINGS_QUERY
             assert "utilityFilters" in payload["variables"]
 
+    def test_get_meter_readings_daily_window_starts_previous_monday(self, api: SevernTrentAPI):
+        """The daily fetch should start at midnight UTC on the previous week's Monday."""
+        from datetime import date
+
+        with self._setup_mock_post(api):
+            api.get_meter_readings()
+            daily_call = api.session.post.call_args_list[2]
+        start_at = daily_call[1]["json"]["variables"]["startAt"]
+        assert start_at.endswith("T00:00:00Z")
+        assert date.fromisoformat(start_at[:10]).weekday() == 0
+
+    @staticmethod
+    def _freeze_now(now):
+        """Patch the API module's clock so "today" is ``now``."""
+        from datetime import datetime
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now if tz is None else now.astimezone(tz)
+
+        return patch("custom_components.severn_trent.api.datetime", _FrozenDatetime)
+
+    @staticmethod
+    def _mock_readings_post(api: SevernTrentAPI, *extra):
+        """Mock post for get_meter_readings with meter identifiers already known."""
+        responses = [
+            _make_response(AUTH_SUCCESS_RESPONSE),
+            _make_response(SMART_METER_DAILY_RESPONSE),
+            _make_response(SMART_METER_MONTHLY_RESPONSE),
+            *extra,
+        ]
+        return patch.object(api.session, "post", MagicMock(side_effect=responses))
+
+    @staticmethod
+    def _smart_meter_start_dates(api: SevernTrentAPI) -> list[str]:
+        """Return the startAt of every SmartMeterReadings request sent."""
+        return [
+            c[1]["json"]["variables"]["startAt"]
+            for c in api.session.post.call_args_list
+            if c[1].get("json", {}).get("operationName") == "SmartMeterReadings"
+        ]
+
+    def test_get_meter_readings_skips_partial_month_for_todays_reading(self, api: SevernTrentAPI):
+        """An official reading from today should not trigger a partial month fetch."""
+        from datetime import datetime, timezone
+
+        now = datetime(2026, 5, 20, 9, 30, tzinfo=timezone.utc)
+        with self._freeze_now(now), self._mock_readings_post(api):
+            result = api.get_meter_readings("2026-05-20T00:00:00Z")
+            start_dates = self._smart_meter_start_dates(api)
+        assert len(start_dates) == 2  # daily and monthly only
+        assert "2026-05-20T00:00:00Z" not in start_dates
+        assert result["daily_readings_since_official"] == []
+
+    def test_get_meter_readings_fetches_partial_month_for_mid_month_reading(self, api: SevernTrentAPI):
+        """An earlier mid-month official reading should fetch daily data from that date."""
+        from datetime import datetime, timezone
+
+        now = datetime(2026, 5, 20, 9, 30, tzinfo=timezone.utc)
+        empty_daily = {"data": {"account": {"properties": [{"measurements": {"edges": []}}]}}}
+        with self._freeze_now(now), self._mock_readings_post(api, _make_response(empty_daily)):
+            api.get_meter_readings("2026-05-12T00:00:00Z")
+            start_dates = self._smart_meter_start_dates(api)
+        assert start_dates[-1] == "2026-05-12T00:00:00Z"
+        assert len(start_dates) == 3  # daily, monthly and partial month
+
     def test_get_meter_readings_returns_usage_data(self, api: SevernTrentAPI):
         """get_meter_readings() should return usage data with expected keys."""
         with self._setup_mock_post(api):
@@ -674,16 +803,48 @@ class TestGetMeterReadings:
             # Should have standard keys even if some values are 0/None
             expected_keys = [
                 "meter_id", "yesterday_usage", "yesterday_date",
-                "daily_average", "unit", "all_readings", "monthly_readings",
+                "daily_average", "unit", "all_readings", "recent_readings",
+                "monthly_readings",
             ]
             for key in expected_keys:
                 assert key in result, f"Missing key: {key}"
+            assert result["recent_readings"] == result["all_readings"][:7]
+
+    def test_get_meter_readings_includes_usage_since_official(self, api: SevernTrentAPI):
+        """get_meter_readings() should pre-compute usage since the official reading."""
+        with self._setup_mock_post(api):
+            result = api.get_meter_readings("2026-04-01T00:00:00Z")
+            # Official reading on the 1st: the April monthly total is included
+            assert result["usage_since_official"] == 4.5
+            assert result["monthly_periods_included"] == 1
+
+    def test_get_meter_readings_monthly_only_payload_has_same_keys(self, api: SevernTrentAPI):
+        """The monthly-only payload should expose the same keys as the full payload."""
+        with self._setup_mock_post(api):
+            full = api.get_meter_readings()
+
+        api.capability_type = "VISUAL"  # skip the DAILY retry
+        empty_daily = {"data": {"account": {"properties": [{"measurements": {"edges": []}}]}}}
+        responses = [  # token and meter identifiers are reused from the first call
+            _make_response(empty_daily),
+            _make_response(SMART_METER_MONTHLY_RESPONSE),
+        ]
+        with patch.object(api.session, "post", MagicMock(side_effect=responses)):
+            monthly_only = api.get_meter_readings()
+
+        assert monthly_only["yesterday_usage"] is None
+        assert set(monthly_only) == set(full)
 
     def test_get_meter_readings_returns_empty_on_auth_failure(self, api: SevernTrentAPI):
-        """get_meter_readings() should return {} when authentication fails."""
-        with patch.object(api, "authenticate", return_value=False):
+        """get_meter_readings() should return {} when re-authentication fails."""
+        api.token = None
+        api.token_expires_at = 0  # expired, so _ensure_valid_token re-authenticates
+        with patch.object(api, "authenticate", return_value=False) as mock_auth, \
+             patch.object(api.session, "post") as mock_post:
             result = api.get_meter_readings()
-            assert result == {}
+        mock_auth.assert_called_once()
+        mock_post.assert_not_called()
+        assert result == {}
 
 
 # ======================================================================
@@ -784,4 +945,62 @@ class TestApiDateTimeFormat:
         assert "+00:00Z" not in result
         assert result.endswith("Z")
         # Should be a valid ISO 8601 datetime
-        assert "T" in result
\ No newline at end of file
+        assert "T" in result
+
+# ======================================================================
+# 17. Usage since official reading helper
+# ======================================================================
+
+class TestUsageSinceOfficial:
+    """Tests for the _usage_since_official helper."""
+
+    MONTHLY = [
+        {"value": 4.0, "start_date": "2026-03-01", "unit": "m³"},
+        {"value": 4.5, "start_date": "2026-04-01", "unit": "m³"},
+        {"value": 2.0, "start_date": "2026-05-01", "unit": "m³"},
+    ]
+
+    def test_first_of_month_includes_official_month(self):
+        """An official reading on the 1st should include that month's total."""
+        from custom_components.severn_trent.api import _usage_since_official
+
+        usage, periods = _usage_since_official("2026-04-01", [], self.MONTHLY)
+        assert usage == 6.5
+        assert periods == 2
+
+    def test_mid_month_uses_daily_for_partial_month(self):
+        """A mid-month official reading should sum daily usage plus later months."""
+        from custom_components.severn_trent.api import _usage_since_official
+
+        daily = [
+            {"value": 0.2, "date": "2026-04-15", "unit": "m³"},
+            {"value": 0.3, "date": "2026-04-16", "unit": "m³"},
+        ]
+        usage, periods = _usage_since_official("2026-04-15T00:00:00Z", daily, self.MONTHLY)
+        assert round(usage, 3) == 2.5
+        assert periods == 1
+
+    def test_daily_sum_does_not_accumulate_float_error(self):
+        """Many small daily values should sum without floating point drift."""
+        from custom_components.severn_trent.api import _usage_since_official
+
+        daily = [{"value": 0.1, "date": "2026-05-20", "unit": "m³"}] * 10
+        usage, periods = _usage_since_official("2026-05-20", daily, self.MONTHLY)
+        assert usage == 1.0
+        assert periods == 0
+
+    def test_official_date_outside_monthly_range(self):
+        """Readings before every month include all of them; after, none."""
+        from custom_components.severn_trent.api import _usage_since_official
+
+        usage, periods = _usage_since_official("2026-02-10", [], self.MONTHLY)
+        assert usage == 10.5
+        assert periods == 3
+        assert _usage_since_official("2026-05-10", [], self.MONTHLY) == (0, 0)
+
+    def test_missing_or_invalid_official_date(self):
+        """No official date (or an unparseable one) should contribute nothing."""
+        from custom_components.severn_trent.api import _usage_since_official
+
+        assert _usage_since_official(None, [], self.MONTHLY) == (0, 0)
+        assert _usage_since_official("not-a-date", [], self.MONTHLY) == (0, 0)
@@ -0,0 +1,71 @@
+"""Tests for the coordinator helpers in the integration's __init__.py."""
+from __future__ import annotations
+
+from datetime import date
+
+from custom_components.severn_trent import (
+    _balance_or_last_known,
+    _estimate_meter_reading,
+)
+
+
+BALANCE = {"balance_gbp": -12.5, "balance_pence": -1250}
+
+
+class TestBalanceOrLastKnown:
+    """Tests for the balance fallback used by the coordinator refresh."""
+
+    def test_fresh_balance_is_returned_unchanged(self):
+        """A successful fetch should be used as-is, without a stale marker."""
+        previous = {"balance": {**BALANCE, "stale": True}}
+        assert _balance_or_last_known(BALANCE, previous) is BALANCE
+
+    def test_failed_fetch_keeps_last_known_balance_once(self):
+        """A single failed fetch should reuse the previous balance, marked stale."""
+        result = _balance_or_last_known({}, {"balance": BALANCE})
+        assert result == {**BALANCE, "stale": True}
+        assert "stale" not in BALANCE
+
+    def test_second_failed_fetch_drops_stale_balance(self):
+        """A stale balance should not be carried over a second failed refresh."""
+        previous = {"balance": _balance_or_last_known({}, {"balance": BALANCE})}
+        assert _balance_or_last_known({}, previous) == {}
+
+    def test_failed_fetch_without_previous_data(self):
+        """With no earlier refresh there is nothing to fall back to."""
+        assert _balance_or_last_known({}, None) == {}
+        assert _balance_or_last_known({}, {"balance": {}}) == {}
+
+
+class TestEstimateMeterReading:
+    """Tests for the estimated meter reading helper."""
+
+    MANUAL = {"latest_reading": 100.0, "reading_date": "2026-04-15T00:00:00Z"}
+
+    def test_adds_usage_since_official(self):
+        """The estimate should be the official reading plus usage since it."""
+        smart = {
+            "usage_since_official": 2.5,
+            "monthly_periods_included": 1,
+            "daily_readings_since_official": [{"value": 0.5}] * 3,
+        }
+        result = _estimate_meter_reading(self.MANUAL, smart, date(2026, 5, 15))
+        assert result["value"] == 102.5
+        assert result["attrs"]["days_since_official"] == 30
+        assert result["attrs"]["daily_periods_included"] == 3
+        assert result["attrs"]["monthly_periods_included"] == 1
+
+    def test_without_smart_data_returns_official_reading(self):
+        """With no smart meter data the estimate falls back to the official value."""
+        result = _estimate_meter_reading(self.MANUAL, {}, date(2026, 4, 15))
+        assert result["value"] == 100.0
+        assert result["attrs"]["usage_since_official"] is None
+
+    def test_missing_or_invalid_official_reading(self):
+        """No official reading (or an unparseable date) gives no estimate."""
+        assert _estimate_meter_reading({}, {}, date(2026, 4, 15)) == {"value": None, "attrs": {}}
+        invalid = _estimate_meter_reading(
+            {"latest_reading": 100.0, "reading_date": "bad"}, {}, date(2026, 4, 15)
+        )
+        assert invalid["value"] is None
+        assert invalid["attrs"]["last_official_date"] == "bad"